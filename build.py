@@ -12,66 +12,297 @@ import json
 import sys
 import os
 import time
+import io
+import re
 import html
 import hashlib
-from datetime import datetime, timezone
+import pickle
+import zlib
+import functools
+import threading
+from heapq import nlargest
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
 from email.utils import parsedate_to_datetime
-from urllib.request import urlopen, Request
-from urllib.error import URLError, HTTPError
-from xml.etree import ElementTree as ET
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    from lxml import etree as ET
+    HAVE_LXML = True
+except ImportError:
+    from xml.etree import ElementTree as ET
+    HAVE_LXML = False
+
+try:
+    import orjson
+    HAVE_ORJSON = True
+except ImportError:
+    HAVE_ORJSON = False
 
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 MAX_ITEMS = 200
 FETCH_TIMEOUT = 30
+FETCH_WORKERS = 16
+HOST_DELAY = 0.5
+CACHE_PATH = os.path.join(SCRIPT_DIR, ".feed_cache.json")
+CACHE_DIR = os.path.join(SCRIPT_DIR, ".feed_cache")
 USER_AGENT = "TheFutureModern/1.0 (+https://github.com/maxdavis3/the-future-modern)"
 
 
-def load_feeds_config():
-    config_path = os.path.join(SCRIPT_DIR, "feeds.json")
-    with open(config_path, "r") as f:
+def _parser_version():
+    """Fingerprint of this script and its XML backend.
+
+    Pickled items are only reused by the exact build.py (and parser) that
+    produced them, so any change to parsing or the item layout re-parses.
+    """
+    with open(os.path.abspath(__file__), "rb") as f:
+        h = hashlib.blake2b(f.read(), digest_size=8)
+    h.update(b"lxml" if HAVE_LXML else b"etree")
+    return h.hexdigest()
+
+
+CACHE_VERSION = _parser_version()
+
+# Shared session so connections (and TLS handshakes) are reused per host
+SESSION = requests.Session()
+SESSION.headers["User-Agent"] = USER_AGENT
+# Ask for compressed XML; requests decompresses resp.content transparently
+SESSION.headers["Accept-Encoding"] = "gzip, deflate"
+_adapter = HTTPAdapter(pool_connections=32, pool_maxsize=32)
+SESSION.mount("http://", _adapter)
+SESSION.mount("https://", _adapter)
+
+_TAG_RE = re.compile(r"<[^>]*>")
+_DIGEST_RE = re.compile(rb"<!-- content-digest ([0-9a-f]+) -->")
+_ROOT_RE = re.compile(rb"<\s*(feed|rss)\b", re.I)
+_IMG_SRC_RE = re.compile(r"""<img[^>]*?\ssrc\s*=\s*["']([^"']+)""", re.I)
+# Namespace-qualified tags, resolved once instead of per lookup
+_DC_CREATOR = "{http://purl.org/dc/elements/1.1/}creator"
+_MEDIA_CONTENT = "{http://search.yahoo.com/mrss/}content"
+_CONTENT_ENCODED = "{http://purl.org/rss/1.0/modules/content/}encoded"
+_ATOM = "{http://www.w3.org/2005/Atom}"
+_A_ENTRY = _ATOM + "entry"
+_A_TITLE = _ATOM + "title"
+_A_LINK = _ATOM + "link"
+_A_LINK_ALTERNATE = _A_LINK + "[@rel='alternate']"
+_A_SUMMARY = _ATOM + "summary"
+_A_CONTENT = _ATOM + "content"
+_A_UPDATED = _ATOM + "updated"
+_A_PUBLISHED = _ATOM + "published"
+_A_AUTHOR_NAME = _ATOM + "author/" + _ATOM + "name"
+
+_MIN_DATE = datetime.min.replace(tzinfo=timezone.utc)
+_MONTHS = {m: i for i, m in enumerate(
+    ["Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"], 1)}
+
+
+def load_json(path):
+    if HAVE_ORJSON:
+        with open(path, "rb") as f:
+            return orjson.loads(f.read())
+    with open(path, "r") as f:
         return json.load(f)
 
 
-def fetch_feed(url):
-    """Fetch and return raw XML text from a feed URL."""
-    req = Request(url, headers={"User-Agent": USER_AGENT})
+def dump_json(obj, path):
+    if HAVE_ORJSON:
+        with open(path, "wb") as f:
+            f.write(orjson.dumps(obj, option=orjson.OPT_INDENT_2))
+        return
+    with open(path, "w") as f:
+        json.dump(obj, f, indent=2)
+
+
+def load_feeds_config():
+    return load_json(os.path.join(SCRIPT_DIR, "feeds.json"))
+
+
+def load_cache():
+    """Load the conditional-GET cache (url -> etag/last_modified/body)."""
+    try:
+        return load_json(CACHE_PATH)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_cache(cache):
+    dump_json(cache, CACHE_PATH)
+
+
+def prune_cache(cache, urls):
+    """Drop entries for feeds no longer in feeds.json, and any cache file
+    no remaining entry refers to."""
+    for url in set(cache) - urls:
+        del cache[url]
+    keep = {name for entry in cache.values() for name in (entry["body"], entry["items"])}
+    try:
+        names = os.listdir(CACHE_DIR)
+    except OSError:
+        return
+    for name in names:
+        if name not in keep:
+            os.remove(os.path.join(CACHE_DIR, name))
+
+
+def fetch_feed(url, cache):
+    """Fetch raw XML bytes from a feed URL with a conditional GET.
+
+    Returns (body, modified); modified is False when the server answered
+    304 and the cached body was reused. Raises requests.RequestException
+    if the fetch fails.
+    """
+    entry = cache.get(url)
+    headers = {}
+    if entry and os.path.exists(os.path.join(CACHE_DIR, entry["body"])):
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+
+    resp = SESSION.get(url, headers=headers, timeout=FETCH_TIMEOUT)
+    resp.raise_for_status()
+
+    if resp.status_code == 304:
+        with open(os.path.join(CACHE_DIR, entry["body"]), "rb") as f:
+            raw = f.read()
+        modified = False
+    else:
+        raw = resp.content
+        key = hashlib.sha1(url.encode()).hexdigest()
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with open(os.path.join(CACHE_DIR, key + ".xml"), "wb") as f:
+            f.write(raw)
+        cache[url] = {
+            "etag": resp.headers.get("ETag"),
+            "last_modified": resp.headers.get("Last-Modified"),
+            "body": key + ".xml",
+            "items": key + ".pickle",
+        }
+        modified = True
+
+    # Strip BOM if present
+    if raw[:3] == b'\xef\xbb\xbf':
+        raw = raw[3:]
+    # Strip leading whitespace before XML declaration. The bytes are handed
+    # to the parser as-is so it honours the declared encoding.
+    return raw.lstrip(), modified
+
+
+def load_cached_items(entry, source_name, source_category):
+    """Return previously parsed items for an unchanged feed, or None."""
     try:
-        with urlopen(req, timeout=FETCH_TIMEOUT) as resp:
-            raw = resp.read()
-            # Strip BOM if present
-            if raw[:3] == b'\xef\xbb\xbf':
-                raw = raw[3:]
-            text = raw.decode("utf-8", errors="replace")
-            # Strip leading whitespace before XML declaration
-            text = text.lstrip()
-            return text
-    except (URLError, HTTPError) as e:
-        print(f"  ERROR fetching {url}: {e}", file=sys.stderr)
+        with open(os.path.join(CACHE_DIR, entry["items"]), "rb") as f:
+            cached = pickle.load(f)
+    except (OSError, EOFError, pickle.PickleError):
+        return None
+    if cached.get("version") != CACHE_VERSION:
         return None
+    if (cached["source"], cached["category"]) != (source_name, source_category):
+        return None
+    return cached["items"]
+
+
+def save_cached_items(entry, source_name, source_category, items):
+    with open(os.path.join(CACHE_DIR, entry["items"]), "wb") as f:
+        pickle.dump({
+            "version": CACHE_VERSION,
+            "source": source_name,
+            "category": source_category,
+            "items": items,
+        }, f)
 
 
-def parse_rss(xml_text, source_name, source_category):
+def parse_rfc822(value):
+    """Parse an RFC-822 date, with a fast path for the canonical form.
+
+    Handles "Wed, 02 Oct 2024 14:23:45 GMT" / "... +0200" directly and
+    falls back to email.utils for anything else.
+    """
+    try:
+        _, day, month, year, clock, zone = value.split()
+        hour, minute, second = clock.split(":")
+        if len(year) != 4:
+            raise ValueError(year)
+        if zone in ("GMT", "UT", "UTC"):
+            tz = timezone.utc
+        else:
+            offset = timedelta(hours=int(zone[1:3]), minutes=int(zone[3:5]))
+            if zone[0] == "-":
+                offset = -offset
+            elif zone[0] != "+":
+                raise ValueError(zone)
+            tz = timezone(offset)
+        return datetime(int(year), _MONTHS[month], int(day),
+                        int(hour), int(minute), int(second), tzinfo=tz)
+    except (ValueError, KeyError):
+        return parsedate_to_datetime(value)
+
+
+def _iterparse(xml_bytes, tag, force_utf8=False):
+    if force_utf8:
+        # Decode as UTF-8 with U+FFFD for bad bytes, as the build always did
+        # before parsing from bytes; structural errors still raise.
+        xml_bytes = xml_bytes.decode("utf-8", errors="replace").encode("utf-8")
+    if HAVE_LXML:
+        # lxml prunes the event stream to matching tags itself
+        return ET.iterparse(io.BytesIO(xml_bytes), tag=tag,
+                            encoding="utf-8" if force_utf8 else None)
+    if force_utf8:
+        return ET.iterparse(io.StringIO(xml_bytes.decode("utf-8")))
+    return ET.iterparse(io.BytesIO(xml_bytes))
+
+
+def iter_elements(xml_bytes, tag):
+    """Stream elements matching tag, clearing each once it has been consumed.
+
+    If the document fails to parse (typically stray cp1252 bytes in a feed
+    declared as UTF-8) it is re-read once as UTF-8 with undecodable bytes
+    replaced, skipping the elements already yielded. Malformed XML is not
+    repaired: the second failure raises ET.ParseError, and callers drop the
+    whole feed.
+    """
+    consumed = 0
+    try:
+        for _, elem in _iterparse(xml_bytes, tag):
+            if elem.tag == tag:
+                yield elem
+                elem.clear()
+                consumed += 1
+        return
+    except ET.ParseError:
+        pass
+
+    for _, elem in _iterparse(xml_bytes, tag, force_utf8=True):
+        if elem.tag == tag:
+            if consumed:
+                consumed -= 1
+            else:
+                yield elem
+            elem.clear()
+
+
+def parse_rss(xml_bytes, source_name, source_category):
     """Parse RSS 2.0 feed XML into a list of item dicts."""
     items = []
-    try:
-        root = ET.fromstring(xml_text)
-    except ET.ParseError as e:
-        print(f"  XML parse error for {source_name}: {e}", file=sys.stderr)
-        return items
+    source_h = html.escape(source_name)
+    category_h = html.escape(source_category)
 
     # RSS 2.0
-    for item in root.findall(".//item"):
+    for item in iter_elements(xml_bytes, "item"):
         title = item.findtext("title", "").strip()
         link = item.findtext("link", "").strip()
         desc = item.findtext("description", "").strip()
         pub_date_str = item.findtext("pubDate", "").strip()
-        author = item.findtext("{http://purl.org/dc/elements/1.1/}creator", "").strip()
+        author = item.findtext(_DC_CREATOR, "").strip()
         if not author:
             author = item.findtext("author", "").strip()
 
         # Parse image from content:encoded, media:content, or enclosure
         image = ""
-        media = item.find("{http://search.yahoo.com/mrss/}content")
+        media = item.find(_MEDIA_CONTENT)
         if media is not None:
             image = media.get("url", "")
         if not image:
@@ -80,67 +311,66 @@ def parse_rss(xml_text, source_name, source_category):
                 image = enclosure.get("url", "")
         if not image:
             # Try to extract first image from content:encoded
-            content = item.findtext("{http://purl.org/rss/1.0/modules/content/}encoded", "")
-            if content:
-                img_start = content.find('<img')
-                if img_start != -1:
-                    src_start = content.find('src="', img_start)
-                    if src_start != -1:
-                        src_start += 5
-                        src_end = content.find('"', src_start)
-                        if src_end != -1:
-                            image = content[src_start:src_end]
+            content = item.findtext(_CONTENT_ENCODED, "")
+            m = _IMG_SRC_RE.search(content)
+            if m:
+                image = m.group(1)
 
         pub_date = None
         if pub_date_str:
             try:
-                pub_date = parsedate_to_datetime(pub_date_str)
+                pub_date = parse_rfc822(pub_date_str)
             except (ValueError, TypeError):
                 pass
 
         if title and link:
+            description = strip_html(desc)[:300]
             items.append({
                 "title": title,
                 "link": link,
-                "description": strip_html(desc)[:300],
+                "description": description,
                 "date": pub_date,
                 "source": source_name,
                 "category": source_category,
                 "author": author,
                 "image": image,
+                # Pre-escaped copies for write_html
+                "title_h": html.escape(title),
+                "link_h": html.escape(link),
+                "description_h": html.escape(description),
+                "source_h": source_h,
+                "category_h": category_h,
+                "author_h": html.escape(author),
+                "image_h": html.escape(image),
             })
 
     return items
 
 
-def parse_atom(xml_text, source_name, source_category):
+def parse_atom(xml_bytes, source_name, source_category):
     """Parse Atom feed XML into a list of item dicts."""
     items = []
-    ns = {"atom": "http://www.w3.org/2005/Atom"}
-    try:
-        root = ET.fromstring(xml_text)
-    except ET.ParseError as e:
-        print(f"  XML parse error for {source_name}: {e}", file=sys.stderr)
-        return items
+    source_h = html.escape(source_name)
+    category_h = html.escape(source_category)
 
-    for entry in root.findall("atom:entry", ns):
-        title = entry.findtext("atom:title", "", ns).strip()
-        link_el = entry.find("atom:link[@rel='alternate']", ns)
+    for entry in iter_elements(xml_bytes, _A_ENTRY):
+        title = entry.findtext(_A_TITLE, "").strip()
+        link_el = entry.find(_A_LINK_ALTERNATE)
         if link_el is None:
-            link_el = entry.find("atom:link", ns)
+            link_el = entry.find(_A_LINK)
         link = link_el.get("href", "") if link_el is not None else ""
 
-        summary = entry.findtext("atom:summary", "", ns).strip()
+        summary = entry.findtext(_A_SUMMARY, "").strip()
         if not summary:
-            content_el = entry.find("atom:content", ns)
+            content_el = entry.find(_A_CONTENT)
             if content_el is not None and content_el.text:
                 summary = content_el.text.strip()
 
-        updated = entry.findtext("atom:updated", "", ns).strip()
-        published = entry.findtext("atom:published", "", ns).strip()
+        updated = entry.findtext(_A_UPDATED, "").strip()
+        published = entry.findtext(_A_PUBLISHED, "").strip()
         date_str = published or updated
 
-        author_el = entry.find("atom:author/atom:name", ns)
+        author_el = entry.find(_A_AUTHOR_NAME)
         author = author_el.text.strip() if author_el is not None and author_el.text else ""
 
         pub_date = None
@@ -151,15 +381,24 @@ def parse_atom(xml_text, source_name, source_category):
                 pass
 
         if title and link:
+            description = strip_html(summary)[:300]
             items.append({
                 "title": title,
                 "link": link,
-                "description": strip_html(summary)[:300],
+                "description": description,
                 "date": pub_date,
                 "source": source_name,
                 "category": source_category,
                 "author": author,
                 "image": "",
+                # Pre-escaped copies for write_html
+                "title_h": html.escape(title),
+                "link_h": html.escape(link),
+                "description_h": html.escape(description),
+                "source_h": source_h,
+                "category_h": category_h,
+                "author_h": html.escape(author),
+                "image_h": "",
             })
 
     return items
@@ -167,309 +406,324 @@ def parse_atom(xml_text, source_name, source_category):
 
 def strip_html(text):
     """Remove HTML tags from a string."""
-    result = []
-    in_tag = False
-    for ch in text:
-        if ch == '<':
-            in_tag = True
-        elif ch == '>':
-            in_tag = False
-        elif not in_tag:
-            result.append(ch)
-    return html.unescape("".join(result)).strip()
+    return html.unescape(_TAG_RE.sub("", text)).strip()
 
 
 def format_date(dt):
-    """Format a datetime for display."""
+    """Format a datetime for display.
+
+    The page carries absolute dates so it only changes when the feeds do;
+    filters.js relabels recent ones as relative ages ("3h ago") on load.
+    """
     if dt is None:
         return ""
-    now = datetime.now(timezone.utc)
-    diff = now - dt
-    if diff.days == 0:
-        hours = diff.seconds // 3600
-        if hours == 0:
-            mins = diff.seconds // 60
-            return f"{mins}m ago" if mins > 0 else "just now"
-        return f"{hours}h ago"
-    elif diff.days == 1:
-        return "yesterday"
-    elif diff.days < 7:
-        return f"{diff.days}d ago"
-    else:
-        return dt.strftime("%b %d, %Y")
+    return dt.strftime("%b %d, %Y")
 
 
+@functools.lru_cache(maxsize=None)
 def generate_color(name):
     """Generate a consistent muted color for a source name."""
-    h = int(hashlib.md5(name.encode()).hexdigest()[:6], 16)
-    hue = h % 360
+    hue = zlib.crc32(name.encode()) % 360
     return f"hsl({hue}, 40%, 45%)"
 
 
-def generate_html(config, items):
-    """Generate the full index.html content."""
-    title = config.get("title", "The Future Modern")
-    description = config.get("description", "")
-    sources = sorted(set(item["source"] for item in items))
-    categories = sorted(set(item["category"] for item in items))
-    build_time = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M UTC")
+_STYLES_CSS = """:root {
+    --bg: #fafaf8;
+    --text: #1a1a1a;
+    --text-secondary: #666;
+    --border: #e5e5e0;
+    --surface: #fff;
+    --hover: #f5f5f0;
+    --accent: #2d2d2d;
+}
+
+@media (prefers-color-scheme: dark) {
+    :root {
+        --bg: #111;
+        --text: #e8e8e3;
+        --text-secondary: #999;
+        --border: #2a2a2a;
+        --surface: #1a1a1a;
+        --hover: #222;
+        --accent: #e8e8e3;
+    }
+}
+
+* { margin: 0; padding: 0; box-sizing: border-box; }
+
+body {
+    font-family: -apple-system, BlinkMacSystemFont, "Segoe UI", Roboto, "Helvetica Neue", sans-serif;
+    background: var(--bg);
+    color: var(--text);
+    line-height: 1.6;
+    -webkit-font-smoothing: antialiased;
+}
+
+.container {
+    max-width: 900px;
+    margin: 0 auto;
+    padding: 0 24px;
+}
+
+header {
+    padding: 48px 0 32px;
+    border-bottom: 1px solid var(--border);
+    margin-bottom: 8px;
+}
+
+header h1 {
+    font-size: 28px;
+    font-weight: 700;
+    letter-spacing: -0.5px;
+    color: var(--accent);
+}
+
+header p {
+    font-size: 14px;
+    color: var(--text-secondary);
+    margin-top: 4px;
+}
+
+.filters {
+    padding: 16px 0;
+    border-bottom: 1px solid var(--border);
+    display: flex;
+    flex-wrap: wrap;
+    gap: 6px;
+    align-items: center;
+}
+
+.filter-label {
+    font-size: 11px;
+    text-transform: uppercase;
+    letter-spacing: 1px;
+    color: var(--text-secondary);
+    margin-right: 8px;
+    font-weight: 600;
+}
+
+.filter-btn {
+    background: none;
+    border: 1px solid var(--border);
+    padding: 4px 12px;
+    border-radius: 20px;
+    font-size: 12px;
+    cursor: pointer;
+    color: var(--text-secondary);
+    transition: all 0.15s;
+    font-family: inherit;
+}
+
+.filter-btn:hover {
+    border-color: var(--text);
+    color: var(--text);
+}
+
+.filter-btn.active {
+    background: var(--accent);
+    color: var(--bg);
+    border-color: var(--accent);
+}
+
+.feed {
+    list-style: none;
+}
+
+.item {
+    padding: 20px 0;
+    border-bottom: 1px solid var(--border);
+    display: flex;
+    gap: 20px;
+    transition: opacity 0.2s;
+}
+
+.item.hidden {
+    display: none;
+}
+
+.item-image {
+    flex-shrink: 0;
+    width: 140px;
+    height: 100px;
+    border-radius: 6px;
+    overflow: hidden;
+    background: var(--hover);
+}
+
+.item-image img {
+    width: 100%;
+    height: 100%;
+    object-fit: cover;
+}
+
+.item-content {
+    flex: 1;
+    min-width: 0;
+}
+
+.item-meta {
+    display: flex;
+    align-items: center;
+    gap: 12px;
+    margin-bottom: 6px;
+    font-size: 12px;
+}
+
+.item-source {
+    font-weight: 600;
+    text-transform: uppercase;
+    letter-spacing: 0.5px;
+    font-size: 11px;
+}
+
+.item-date {
+    color: var(--text-secondary);
+}
+
+.item-title {
+    font-size: 17px;
+    font-weight: 600;
+    line-height: 1.35;
+    letter-spacing: -0.2px;
+}
+
+.item-title a {
+    color: var(--text);
+    text-decoration: none;
+}
+
+.item-title a:hover {
+    text-decoration: underline;
+}
+
+.item-desc {
+    font-size: 14px;
+    color: var(--text-secondary);
+    margin-top: 6px;
+    line-height: 1.5;
+    display: -webkit-box;
+    -webkit-line-clamp: 2;
+    -webkit-box-orient: vertical;
+    overflow: hidden;
+}
+
+.item-author {
+    font-size: 12px;
+    color: var(--text-secondary);
+    margin-top: 4px;
+    display: block;
+}
+
+footer {
+    padding: 32px 0;
+    text-align: center;
+    font-size: 12px;
+    color: var(--text-secondary);
+    border-top: 1px solid var(--border);
+    margin-top: 24px;
+}
+
+@media (max-width: 640px) {
+    header { padding: 32px 0 24px; }
+    header h1 { font-size: 22px; }
+    .item { flex-direction: column; gap: 12px; }
+    .item-image { width: 100%; height: 180px; }
+    .item-title { font-size: 15px; }
+    .container { padding: 0 16px; }
+}
+"""
 
-    items_html = []
-    for item in items:
-        date_str = format_date(item["date"])
-        source_color = generate_color(item["source"])
-        desc = html.escape(item["description"]) if item["description"] else ""
 
-        image_html = ""
-        if item["image"]:
-            image_html = f'<div class="item-image"><img src="{html.escape(item["image"])}" alt="" loading="lazy" onerror="this.parentElement.remove()"></div>'
-
-        author_html = ""
-        if item["author"]:
-            author_html = f'<span class="item-author">by {html.escape(item["author"])}</span>'
+_FILTERS_JS = """function relativeAge(date) {
+    const secs = Math.max(0, (Date.now() - date.getTime()) / 1000);
+    const days = Math.floor(secs / 86400);
+    if (days === 0) {
+        const hours = Math.floor(secs / 3600);
+        if (hours === 0) {
+            const mins = Math.floor(secs / 60);
+            return mins > 0 ? mins + "m ago" : "just now";
+        }
+        return hours + "h ago";
+    } else if (days === 1) {
+        return "yesterday";
+    } else if (days < 7) {
+        return days + "d ago";
+    }
+    return null;
+}
+
+document.addEventListener("DOMContentLoaded", function() {
+    document.querySelectorAll("time.item-date").forEach(el => {
+        const date = new Date(el.getAttribute("datetime"));
+        const age = isNaN(date) ? null : relativeAge(date);
+        if (age) el.textContent = age;
+    });
+
+    const buttons = document.querySelectorAll(".filter-btn");
+    const items = document.querySelectorAll(".item");
+    let activeSource = null;
+    let activeCategory = null;
+
+    function applyFilters() {
+        items.forEach(item => {
+            const matchSource = !activeSource || item.dataset.source === activeSource;
+            const matchCategory = !activeCategory || item.dataset.category === activeCategory;
+            item.classList.toggle("hidden", !(matchSource && matchCategory));
+        });
+    }
+
+    buttons.forEach(btn => {
+        btn.addEventListener("click", function() {
+            if (this.dataset.filterAll !== undefined) {
+                activeSource = null;
+                activeCategory = null;
+                buttons.forEach(b => b.classList.remove("active"));
+                this.classList.add("active");
+            } else if (this.dataset.filterSource) {
+                const src = this.dataset.filterSource;
+                if (activeSource === src) {
+                    activeSource = null;
+                    this.classList.remove("active");
+                } else {
+                    buttons.forEach(b => { if (b.dataset.filterSource) b.classList.remove("active"); });
+                    activeSource = src;
+                    this.classList.add("active");
+                }
+                document.querySelector("[data-filter-all]").classList.toggle("active", !activeSource && !activeCategory);
+            } else if (this.dataset.filterCategory) {
+                const cat = this.dataset.filterCategory;
+                if (activeCategory === cat) {
+                    activeCategory = null;
+                    this.classList.remove("active");
+                } else {
+                    buttons.forEach(b => { if (b.dataset.filterCategory) b.classList.remove("active"); });
+                    activeCategory = cat;
+                    this.classList.add("active");
+                }
+                document.querySelector("[data-filter-all]").classList.toggle("active", !activeSource && !activeCategory);
+            }
+            applyFilters();
+        });
+    });
+});
+"""
 
-        items_html.append(f"""
-        <article class="item" data-source="{html.escape(item["source"])}" data-category="{html.escape(item["category"])}">
-            {image_html}
-            <div class="item-content">
-                <div class="item-meta">
-                    <span class="item-source" style="color: {source_color}">{html.escape(item["source"])}</span>
-                    <span class="item-date">{date_str}</span>
-                </div>
-                <h2 class="item-title"><a href="{html.escape(item["link"])}" target="_blank" rel="noopener">{html.escape(item["title"])}</a></h2>
-                {"<p class='item-desc'>" + desc + "</p>" if desc else ""}
-                {author_html}
-            </div>
-        </article>""")
 
-    source_filters = "\n".join(
-        f'            <button class="filter-btn" data-filter-source="{html.escape(s)}">{html.escape(s)}</button>'
-        for s in sources
-    )
-    category_filters = "\n".join(
-        f'            <button class="filter-btn" data-filter-category="{html.escape(c)}">{html.escape(c)}</button>'
-        for c in categories
-    )
-
-    return f"""<!DOCTYPE html>
+_HEAD_TMPL = """<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{html.escape(title)}</title>
-    <meta name="description" content="{html.escape(description)}">
-    <style>
-        :root {{
-            --bg: #fafaf8;
-            --text: #1a1a1a;
-            --text-secondary: #666;
-            --border: #e5e5e0;
-            --surface: #fff;
-            --hover: #f5f5f0;
-            --accent: #2d2d2d;
-        }}
-
-        @media (prefers-color-scheme: dark) {{
-            :root {{
-                --bg: #111;
-                --text: #e8e8e3;
-                --text-secondary: #999;
-                --border: #2a2a2a;
-                --surface: #1a1a1a;
-                --hover: #222;
-                --accent: #e8e8e3;
-            }}
-        }}
-
-        * {{ margin: 0; padding: 0; box-sizing: border-box; }}
-
-        body {{
-            font-family: -apple-system, BlinkMacSystemFont, "Segoe UI", Roboto, "Helvetica Neue", sans-serif;
-            background: var(--bg);
-            color: var(--text);
-            line-height: 1.6;
-            -webkit-font-smoothing: antialiased;
-        }}
-
-        .container {{
-            max-width: 900px;
-            margin: 0 auto;
-            padding: 0 24px;
-        }}
-
-        header {{
-            padding: 48px 0 32px;
-            border-bottom: 1px solid var(--border);
-            margin-bottom: 8px;
-        }}
-
-        header h1 {{
-            font-size: 28px;
-            font-weight: 700;
-            letter-spacing: -0.5px;
-            color: var(--accent);
-        }}
-
-        header p {{
-            font-size: 14px;
-            color: var(--text-secondary);
-            margin-top: 4px;
-        }}
-
-        .filters {{
-            padding: 16px 0;
-            border-bottom: 1px solid var(--border);
-            display: flex;
-            flex-wrap: wrap;
-            gap: 6px;
-            align-items: center;
-        }}
-
-        .filter-label {{
-            font-size: 11px;
-            text-transform: uppercase;
-            letter-spacing: 1px;
-            color: var(--text-secondary);
-            margin-right: 8px;
-            font-weight: 600;
-        }}
-
-        .filter-btn {{
-            background: none;
-            border: 1px solid var(--border);
-            padding: 4px 12px;
-            border-radius: 20px;
-            font-size: 12px;
-            cursor: pointer;
-            color: var(--text-secondary);
-            transition: all 0.15s;
-            font-family: inherit;
-        }}
-
-        .filter-btn:hover {{
-            border-color: var(--text);
-            color: var(--text);
-        }}
-
-        .filter-btn.active {{
-            background: var(--accent);
-            color: var(--bg);
-            border-color: var(--accent);
-        }}
-
-        .feed {{
-            list-style: none;
-        }}
-
-        .item {{
-            padding: 20px 0;
-            border-bottom: 1px solid var(--border);
-            display: flex;
-            gap: 20px;
-            transition: opacity 0.2s;
-        }}
-
-        .item.hidden {{
-            display: none;
-        }}
-
-        .item-image {{
-            flex-shrink: 0;
-            width: 140px;
-            height: 100px;
-            border-radius: 6px;
-            overflow: hidden;
-            background: var(--hover);
-        }}
-
-        .item-image img {{
-            width: 100%;
-            height: 100%;
-            object-fit: cover;
-        }}
-
-        .item-content {{
-            flex: 1;
-            min-width: 0;
-        }}
-
-        .item-meta {{
-            display: flex;
-            align-items: center;
-            gap: 12px;
-            margin-bottom: 6px;
-            font-size: 12px;
-        }}
-
-        .item-source {{
-            font-weight: 600;
-            text-transform: uppercase;
-            letter-spacing: 0.5px;
-            font-size: 11px;
-        }}
-
-        .item-date {{
-            color: var(--text-secondary);
-        }}
-
-        .item-title {{
-            font-size: 17px;
-            font-weight: 600;
-            line-height: 1.35;
-            letter-spacing: -0.2px;
-        }}
-
-        .item-title a {{
-            color: var(--text);
-            text-decoration: none;
-        }}
-
-        .item-title a:hover {{
-            text-decoration: underline;
-        }}
-
-        .item-desc {{
-            font-size: 14px;
-            color: var(--text-secondary);
-            margin-top: 6px;
-            line-height: 1.5;
-            display: -webkit-box;
-            -webkit-line-clamp: 2;
-            -webkit-box-orient: vertical;
-            overflow: hidden;
-        }}
-
-        .item-author {{
-            font-size: 12px;
-            color: var(--text-secondary);
-            margin-top: 4px;
-            display: block;
-        }}
-
-        footer {{
-            padding: 32px 0;
-            text-align: center;
-            font-size: 12px;
-            color: var(--text-secondary);
-            border-top: 1px solid var(--border);
-            margin-top: 24px;
-        }}
-
-        @media (max-width: 640px) {{
-            header {{ padding: 32px 0 24px; }}
-            header h1 {{ font-size: 22px; }}
-            .item {{ flex-direction: column; gap: 12px; }}
-            .item-image {{ width: 100%; height: 180px; }}
-            .item-title {{ font-size: 15px; }}
-            .container {{ padding: 0 16px; }}
-        }}
-    </style>
+    <title>{title}</title>
+    <meta name="description" content="{description}">
+    <link rel="stylesheet" href="styles.css">
+    <script src="filters.js" defer></script>
 </head>
 <body>
     <div class="container">
         <header>
-            <h1>{html.escape(title)}</h1>
-            <p>{html.escape(description)}</p>
+            <h1>{title}</h1>
+            <p>{description}</p>
         </header>
 
         <div class="filters">
@@ -481,69 +735,180 @@ def generate_html(config, items):
         </div>
 
         <div class="feed" id="feed">
-{"".join(items_html)}
+"""
+
+
+_ITEM_TEMPLATE = """
+        <article class="item" data-source="{source}" data-category="{category}">
+            {image}
+            <div class="item-content">
+                <div class="item-meta">
+                    <span class="item-source" style="color: {color}">{source}</span>
+                    <time class="item-date" datetime="{datetime}">{date}</time>
+                </div>
+                <h2 class="item-title"><a href="{link}" target="_blank" rel="noopener">{title}</a></h2>
+                {desc}
+                {author}
+            </div>
+        </article>"""
+
+
+_FOOT_TMPL = """
         </div>
 
         <footer>
             <p>Last updated: {build_time}</p>
-            <p style="margin-top: 4px">{len(items)} items from {len(sources)} sources</p>
+            <p style="margin-top: 4px">{item_count} items from {source_count} sources</p>
         </footer>
     </div>
-
-    <script>
-        document.addEventListener("DOMContentLoaded", function() {{
-            const buttons = document.querySelectorAll(".filter-btn");
-            const items = document.querySelectorAll(".item");
-            let activeSource = null;
-            let activeCategory = null;
-
-            function applyFilters() {{
-                items.forEach(item => {{
-                    const matchSource = !activeSource || item.dataset.source === activeSource;
-                    const matchCategory = !activeCategory || item.dataset.category === activeCategory;
-                    item.classList.toggle("hidden", !(matchSource && matchCategory));
-                }});
-            }}
-
-            buttons.forEach(btn => {{
-                btn.addEventListener("click", function() {{
-                    if (this.dataset.filterAll !== undefined) {{
-                        activeSource = null;
-                        activeCategory = null;
-                        buttons.forEach(b => b.classList.remove("active"));
-                        this.classList.add("active");
-                    }} else if (this.dataset.filterSource) {{
-                        const src = this.dataset.filterSource;
-                        if (activeSource === src) {{
-                            activeSource = null;
-                            this.classList.remove("active");
-                        }} else {{
-                            buttons.forEach(b => {{ if (b.dataset.filterSource) b.classList.remove("active"); }});
-                            activeSource = src;
-                            this.classList.add("active");
-                        }}
-                        document.querySelector("[data-filter-all]").classList.toggle("active", !activeSource && !activeCategory);
-                    }} else if (this.dataset.filterCategory) {{
-                        const cat = this.dataset.filterCategory;
-                        if (activeCategory === cat) {{
-                            activeCategory = null;
-                            this.classList.remove("active");
-                        }} else {{
-                            buttons.forEach(b => {{ if (b.dataset.filterCategory) b.classList.remove("active"); }});
-                            activeCategory = cat;
-                            this.classList.add("active");
-                        }}
-                        document.querySelector("[data-filter-all]").classList.toggle("active", !activeSource && !activeCategory);
-                    }}
-                    applyFilters();
-                }});
-            }});
-        }});
-    </script>
+    <!-- content-digest {digest} -->
 </body>
 </html>"""
 
 
+def write_html(config, items, fp):
+    """Write the full index.html content to an open file.
+
+    Returns a digest of everything above the footer, which is hashed as it
+    is written and recorded in the footer so unchanged builds can be skipped.
+    """
+    title = config.get("title", "The Future Modern")
+    description = config.get("description", "")
+    sources = sorted(set(item["source"] for item in items))
+    categories = sorted(set(item["category"] for item in items))
+    build_time = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M UTC")
+    digest = hashlib.blake2b(digest_size=16)
+
+    def emit(text):
+        fp.write(text)
+        digest.update(text.encode())
+
+    # Each filter button uses its escaped name twice; items carry their own
+    src_esc = {s: html.escape(s) for s in sources}
+    cat_esc = {c: html.escape(c) for c in categories}
+
+    source_filters = "\n".join(
+        f'            <button class="filter-btn" data-filter-source="{src_esc[s]}">{src_esc[s]}</button>'
+        for s in sources
+    )
+    category_filters = "\n".join(
+        f'            <button class="filter-btn" data-filter-category="{cat_esc[c]}">{cat_esc[c]}</button>'
+        for c in categories
+    )
+
+    emit(_HEAD_TMPL.format(
+        title=html.escape(title),
+        description=html.escape(description),
+        category_filters=category_filters,
+        source_filters=source_filters,
+    ))
+
+    for item in items:
+        date_str = format_date(item["date"])
+        desc = item["description_h"]
+
+        image_html = ""
+        if item["image_h"]:
+            image_html = f'<div class="item-image"><img src="{item["image_h"]}" alt="" loading="lazy" onerror="this.parentElement.remove()"></div>'
+
+        author_html = ""
+        if item["author_h"]:
+            author_html = f'<span class="item-author">by {item["author_h"]}</span>'
+
+        emit(_ITEM_TEMPLATE.format_map({
+            "source": item["source_h"],
+            "category": item["category_h"],
+            "color": generate_color(item["source"]),
+            "image": image_html,
+            "date": date_str,
+            "datetime": item["date"].isoformat() if item["date"] else "",
+            "link": item["link_h"],
+            "title": item["title_h"],
+            "desc": "<p class='item-desc'>" + desc + "</p>" if desc else "",
+            "author": author_html,
+        }))
+
+    fp.write(_FOOT_TMPL.format(
+        build_time=build_time,
+        item_count=len(items),
+        source_count=len(sources),
+        digest=digest.hexdigest(),
+    ))
+    return digest.hexdigest()
+
+
+def write_static(path, content):
+    """Write a static asset next to the page unless it is already up to date."""
+    try:
+        with open(path, "r") as f:
+            if f.read() == content:
+                return
+    except OSError:
+        pass
+    with open(path, "w") as f:
+        f.write(content)
+
+
+def read_digest(path):
+    """Return the content digest recorded in an existing page's footer."""
+    try:
+        with open(path, "rb") as f:
+            # The footer is short and fixed-shape, so the tail is enough
+            f.seek(0, os.SEEK_END)
+            f.seek(max(0, f.tell() - 1024))
+            m = _DIGEST_RE.search(f.read())
+    except OSError:
+        return None
+    return m.group(1).decode() if m else None
+
+
+def process_feed(feed, host_locks, cache):
+    """Fetch, detect and parse a single feed.
+
+    Returns (items, error). items is None if the fetch failed; error is a
+    message for main() to print, so output stays in feeds.json order
+    rather than appearing as worker threads hit problems.
+    """
+    name = feed["name"]
+    url = feed["url"]
+    category = feed.get("category", "")
+
+    # Requests to the same host are serialized with a polite delay;
+    # different hosts are fetched concurrently.
+    with host_locks[urlparse(url).netloc]:
+        try:
+            xml_bytes, modified = fetch_feed(url, cache)
+        except requests.RequestException as e:
+            return None, f"  ERROR fetching {url}: {e}"
+        finally:
+            time.sleep(HOST_DELAY)  # polite delay
+
+    entry = cache[url]
+    if not modified:
+        items = load_cached_items(entry, name, category)
+        if items is not None:
+            return items, None
+
+    # Detect feed type from the first <feed>/<rss> root tag
+    m = _ROOT_RE.search(xml_bytes, 0, 500)
+    kind = m.group(1).lower() if m else b"rss"
+    try:
+        if kind == b"feed":
+            items = parse_atom(xml_bytes, name, category)
+        else:
+            items = parse_rss(xml_bytes, name, category)
+    except ET.ParseError as e:
+        # Never cache a failed parse, and drop items pickled from an older
+        # body so a later 304 re-parses instead of serving them
+        try:
+            os.remove(os.path.join(CACHE_DIR, entry["items"]))
+        except OSError:
+            pass
+        return [], f"  XML parse error for {name}: {e}"
+    save_cached_items(entry, name, category, items)
+    return items, None
+
+
 def main():
     import argparse
     parser = argparse.ArgumentParser(description="Build The Future Modern RSS aggregator")
@@ -552,40 +917,48 @@ def main():
     args = parser.parse_args()
 
     config = load_feeds_config()
+    cache = load_cache()
+    cached = dict(cache)
     all_items = []
 
     print(f"Fetching {len(config['feeds'])} feeds...")
-    for feed in config["feeds"]:
-        name = feed["name"]
-        url = feed["url"]
-        category = feed.get("category", "")
-        print(f"  {name} ({url})...")
-
-        xml_text = fetch_feed(url)
-        if xml_text is None:
+    host_locks = {urlparse(feed["url"]).netloc: threading.Lock() for feed in config["feeds"]}
+    with ThreadPoolExecutor(max_workers=FETCH_WORKERS) as ex:
+        results = list(ex.map(lambda feed: process_feed(feed, host_locks, cache), config["feeds"]))
+    prune_cache(cache, {feed["url"] for feed in config["feeds"]})
+    if cache != cached:
+        save_cache(cache)
+
+    for feed, (items, error) in zip(config["feeds"], results):
+        # Flush so the stderr message lands under its feed when piped
+        print(f"  {feed['name']} ({feed['url']})...", flush=True)
+        if error:
+            print(error, file=sys.stderr)
+        if items is None:
             continue
-
-        # Detect feed type
-        if "<feed" in xml_text[:500]:
-            items = parse_atom(xml_text, name, category)
-        else:
-            items = parse_rss(xml_text, name, category)
-
         print(f"    -> {len(items)} items")
         all_items.extend(items)
 
-        time.sleep(0.5)  # polite delay
-
-    # Sort by date (newest first), items without dates go to end
-    all_items.sort(key=lambda x: x["date"] or datetime.min.replace(tzinfo=timezone.utc), reverse=True)
-    all_items = all_items[:MAX_ITEMS]
+    # Keep the newest MAX_ITEMS (newest first), items without dates go to end
+    all_items = nlargest(MAX_ITEMS, all_items, key=lambda x: x["date"] or _MIN_DATE)
 
     print(f"\nTotal: {len(all_items)} items")
 
-    html_content = generate_html(config, all_items)
-    with open(args.output, "w") as f:
-        f.write(html_content)
-    print(f"Written to {args.output}")
+    out_dir = os.path.dirname(os.path.abspath(args.output))
+    write_static(os.path.join(out_dir, "styles.css"), _STYLES_CSS)
+    write_static(os.path.join(out_dir, "filters.js"), _FILTERS_JS)
+
+    # Render to a temp file and only replace the output if anything but
+    # the footer's build time changed
+    tmp_path = args.output + ".tmp"
+    with open(tmp_path, "w") as f:
+        digest = write_html(config, all_items, f)
+    if read_digest(args.output) == digest:
+        os.remove(tmp_path)
+        print(f"Unchanged, skipped writing {args.output}")
+    else:
+        os.replace(tmp_path, args.output)
+        print(f"Written to {args.output}")
 
 
 if __name__ == "__main__":